@@ -1,15 +1,37 @@
-import random
-from datetime import datetime, timedelta
+import os
+import tempfile
+import threading
+import uuid
+from collections import namedtuple
+from datetime import datetime
+from functools import lru_cache
 from dash import Dash, html, dcc, dash_table, Input, Output
-import plotly.express as px
+from flask_caching import Cache
+import plotly.graph_objects as go
+import plotly.io as pio
 import pandas as pd
+import numpy as np
 
 # Initialize Dash app
 app = Dash(__name__)
 app.title = "Semilogo Designed Warehouse Monitoring Dashboard"
 server = app.server
+# Memoizes the per-selection summaries, so repeat selections (from any user) skip recomputation.
+# Defaults to an in-process cache; set CACHE_TYPE=RedisCache and CACHE_REDIS_URL to share it across workers.
+cache = Cache(server, config={
+    "CACHE_TYPE": os.environ.get("CACHE_TYPE", "SimpleCache"),
+    "CACHE_REDIS_URL": os.environ.get("CACHE_REDIS_URL", "redis://localhost:6379/0"),
+    "CACHE_DEFAULT_TIMEOUT": 300,
+})
 
 # --- Data Generation ---
+rng = np.random.default_rng()  # Shared generator, seeded once per process
+MACHINE_IDS = [f"M-{i}" for i in range(1, 6)]
+# Fixed category sets, so every frame shares the same int8 codes regardless of which values it contains
+MACHINE_ID_DTYPE = pd.CategoricalDtype(MACHINE_IDS)
+STATUS_DTYPE = pd.CategoricalDtype(["success", "failure"])
+ERROR_CODE_DTYPE = pd.CategoricalDtype(["None", "E-100", "E-200", "E-300"])
+
 def generate_data(n=1000):
     """
     Generates a Pandas DataFrame with simulated warehouse data.
@@ -20,208 +42,873 @@ def generate_data(n=1000):
     Returns:
         pandas.DataFrame: A DataFrame with columns:
             - timestamp (datetime): Timestamps within the last 24 hours.
-            - machine_id (str): Machine identifiers (e.g., "M-1", "M-2").
+            - machine_id (category): Machine identifiers (e.g., "M-1", "M-2").
             - task_duration (float): Task durations in minutes.
-            - status (str): "success" or "failure".
-            - error_code (str): Error codes (e.g., "E-100") or "None".
-    """
-    now = datetime.now()
-    past_limit = now - timedelta(days=1)  # Ensure data is within the last 24 hours
-    timestamps = []
-    for _ in range(n):
-        random_minutes = random.randint(0, 1440)
-        timestamps.append(now - timedelta(minutes=random_minutes))
-
-    status = [random.choice(['success'] * 9 + ['failure']) for _ in range(n)]
-    error_codes = [random.choice(["E-100", "E-200", "E-300"] if s == "failure" else ["None"]) for s in status]
+            - status (category): "success" or "failure".
+            - error_code (category): Error codes (e.g., "E-100") or "None".
+    """
+    now = np.datetime64(datetime.now(), "ns")
+    # Ensure data is within the last 24 hours
+    timestamps = now - rng.integers(0, 1441, n).astype("timedelta64[m]")
+
+    # Categoricals are built from integer codes, so no per-row strings are allocated
+    status_codes = (rng.random(n) < 0.1).astype(np.int8)  # 1 is "failure"
+    # Error codes are only drawn for the failed tasks; everything else is "None" (code 0)
+    failure_idx = np.flatnonzero(status_codes)
+    error_code_codes = np.zeros(n, dtype=np.int8)
+    error_code_codes[failure_idx] = rng.integers(1, len(ERROR_CODE_DTYPE.categories), failure_idx.size)
     return pd.DataFrame({
         "timestamp": timestamps,
-        "machine_id": [f"M-{random.randint(1, 5)}" for _ in range(n)],
-        "task_duration": [round(random.uniform(5.0, 60.0), 2) for _ in range(n)],
-        "status": status,
-        "error_code": error_codes
+        "machine_id": pd.Categorical.from_codes(rng.integers(0, len(MACHINE_IDS), n), dtype=MACHINE_ID_DTYPE),
+        "task_duration": np.round(rng.uniform(5.0, 60.0, n), 2),
+        "status": pd.Categorical.from_codes(status_codes, dtype=STATUS_DTYPE),
+        "error_code": pd.Categorical.from_codes(error_code_codes, dtype=ERROR_CODE_DTYPE)
     })
 
+def load_data(n=1000):
+    """
+    Loads the warehouse dataset, optionally persisting it as a Parquet file.
+
+    When the WAREHOUSE_DATA_PATH environment variable is set, the dataset is read from that
+    memory-mapped Parquet file, and generated and written there first if the file does not
+    exist yet. This requires pyarrow. Otherwise, fresh data is generated in memory.
+
+    Args:
+        n (int): The number of data points to generate when no file exists.  Defaults to 1000.
+
+    Returns:
+        pandas.DataFrame: A DataFrame with the columns described in ``generate_data``.
+    """
+    path = os.environ.get("WAREHOUSE_DATA_PATH")
+    if not path:
+        return generate_data(n)
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if not os.path.exists(path):
+        # Several workers may get here at once, so each writes a private temporary file and only
+        # the first one to finish publishes it; the others discard theirs and read the winner's
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".parquet.tmp")
+        os.close(fd)
+        try:
+            pq.write_table(
+                pa.Table.from_pandas(generate_data(n), preserve_index=False),
+                tmp_path,
+                compression="zstd",
+                use_dictionary=True,  # Dictionary-encodes the low-cardinality string columns
+            )
+            # mkstemp creates the file as 0600; give it the mode a plain open() would have
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+            try:
+                os.link(tmp_path, path)  # Atomic, and unlike os.replace never overwrites a published file
+            except FileExistsError:
+                pass
+            except OSError:
+                # The filesystem has no hard links: fall back to an atomic replace, which a worker
+                # racing past the existence check above can still overwrite
+                os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return pq.read_table(path, memory_map=True).to_pandas()
+
+
+def data_file_version():
+    """
+    Identifies the contents of the WAREHOUSE_DATA_PATH file.
+
+    Every process that reads the same file gets the same identifier, so they share cached
+    summaries, while a regenerated file (or a new one on a fresh disk) gets a new one.
+
+    Returns:
+        str: The file's path, size and modification time, or None when no file is configured.
+    """
+    path = os.environ.get("WAREHOUSE_DATA_PATH")
+    if not path:
+        return None
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+DAY_NS = pd.Timedelta(days=1).value  # Length of one day in nanoseconds
+
+
+@lru_cache(maxsize=64)
+def parse_date(date_str):
+    """
+    Parses a date string from the date range picker into midnight of that day.
+
+    The picker re-sends the same ISO strings on every callback, so results are cached.
+
+    Args:
+        date_str (str): Date string emitted by the DatePickerRange (e.g., "2025-01-31").
+
+    Returns:
+        int: Midnight of the given day, in nanoseconds since the epoch.
+    """
+    return pd.Timestamp(date_str).normalize().value
+
+def index_error_codes(frame):
+    """
+    Builds an inverted index from error code to row positions.
+
+    Only failed tasks carry an error code, so this doubles as an index of the failures.
+
+    Args:
+        frame (pandas.DataFrame): Rows sorted by timestamp.
+
+    Returns:
+        dict: Maps each error code (except "None") to the sorted int64 positions of its rows.
+    """
+    codes = frame["error_code"].cat.codes.to_numpy()
+    return {
+        code: np.flatnonzero(codes == i)
+        for i, code in enumerate(frame["error_code"].cat.categories)
+        if code != "None"
+    }
+
+def count_failures(error_code_rows, lo, hi, error_codes):
+    """
+    Counts failures per error code within a range of row positions using binary searches.
+
+    Args:
+        error_code_rows (dict): Output of ``index_error_codes``.
+        lo (int): First row position in range.
+        hi (int): Row position one past the end of the range.
+        error_codes (list): Error codes to include, or None for all of them.
+
+    Returns:
+        dict: Maps each error code with at least one failure in range to its count.
+    """
+    counts = {}
+    for code, rows in error_code_rows.items():
+        if error_codes and code not in error_codes:
+            continue
+        count = int(rows.searchsorted(hi) - rows.searchsorted(lo))
+        if count:
+            counts[code] = count
+    return counts
+
+class Dataset(namedtuple("Dataset", [
+    "version", "df", "timestamps", "error_code_rows", "machine_buckets"
+])):
+    """
+    Immutable snapshot of the dashboard data together with its precomputed lookup structures.
+
+    Callbacks read one snapshot and use it throughout, so a concurrent data swap can never hand
+    them a frame and indexes that belong to different datasets.
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        # Flask-Caching builds memoize keys from repr(), so the version alone identifies a snapshot
+        return f"Dataset(version={self.version!r})"
+
+
+def build_dataset(frame, version):
+    """
+    Normalizes a raw DataFrame and precomputes the lookup structures used by the callbacks.
+
+    Args:
+        frame (pandas.DataFrame): Data with the columns described in ``generate_data``.
+        version (str): Identifier of this snapshot, unique across processes and restarts.
+
+    Returns:
+        Dataset: The prepared snapshot.
+
+    Raises:
+        ValueError: If machine_id, status or error_code holds a missing value or one outside its
+            fixed category list.
+    """
+    # Ensure timestamp is datetime type, at the nanosecond resolution the int64 views below assume
+    frame = frame.assign(timestamp=pd.to_datetime(frame["timestamp"]).astype("datetime64[ns]"))
+    # Low-cardinality string columns are stored as categoricals so filters compare integer codes
+    categoricals = {"machine_id": MACHINE_ID_DTYPE, "status": STATUS_DTYPE, "error_code": ERROR_CODE_DTYPE}
+    raw = frame
+    frame = frame.astype(categoricals)
+    # Values outside the fixed categories become NaN (code -1), which would break the code-based
+    # tallies inside a callback, so a bad file is rejected here instead
+    for name in categoricals:
+        unknown = frame[name].isna().to_numpy()
+        if unknown.any():
+            bad_values = pd.unique(raw[name].to_numpy()[unknown])
+            raise ValueError(
+                f"Column {name!r} has values outside {list(categoricals[name].categories)}: "
+                + ", ".join(sorted(map(repr, bad_values))[:10])
+            )
+    # Durations only carry two decimals, so float32 is precise enough at half the memory
+    frame = frame.astype({"task_duration": np.float32})
+    frame = frame.sort_values("timestamp", ignore_index=True)  # Sorted so date ranges can be binary searched
+    return Dataset(
+        version=version,
+        df=frame,
+        # Sorted int64 nanosecond view of the timestamps, so the date filters compare plain integers
+        timestamps=frame["timestamp"].to_numpy().view("i8"),
+        error_code_rows=index_error_codes(frame),
+        # Per-machine views (frame, timestamp array, error code index), built once instead of masking per callback
+        machine_buckets={
+            machine: (group, group["timestamp"].to_numpy().view("i8"), index_error_codes(group))
+            for machine, group in frame.groupby("machine_id", observed=True, sort=False)
+        },
+    )
+
+
+_dataset_lock = threading.Lock()
+_dataset_ref = [None]
+
+
+def current_dataset():
+    """
+    Returns the active dataset snapshot.
+
+    Returns:
+        Dataset: The current snapshot. Callers should read it once and reuse it.
+    """
+    return _dataset_ref[0]
+
+
+def set_dataset(frame, version=None):
+    """
+    Replaces the active dataset.
+
+    The snapshot is built outside the lock, so the swap itself is a single reference assignment
+    and readers are never blocked on the rebuild.
+
+    Args:
+        frame (pandas.DataFrame): The new raw data.
+        version (str): Identifier for data whose contents are known to match across processes,
+            such as ``data_file_version()``. Defaults to a random identifier, because a shared
+            cache such as Redis outlives the process and must not match another run's data.
+
+    Returns:
+        Dataset: The snapshot that is now active.
+    """
+    dataset = build_dataset(frame, version or uuid.uuid4().hex)
+    with _dataset_lock:
+        _dataset_ref[0] = dataset
+    return dataset
+
+
 # Generate the initial data
-df = generate_data()
-df["timestamp"] = pd.to_datetime(df["timestamp"])  # Ensure timestamp is datetime type
+set_dataset(load_data(), data_file_version())
+# Dropdown options come straight from the fixed category sets instead of scanning the rows
+MACHINE_OPTIONS = [{"label": m, "value": m} for m in MACHINE_ID_DTYPE.categories]
+ERROR_CODE_OPTIONS = [{"label": ec, "value": ec} for ec in ERROR_CODE_DTYPE.categories if ec != "None"]
+TABLE_COLUMNS = [{"name": c, "id": c} for c in ("timestamp", "machine_id", "task_duration", "status", "error_code")]
+
+def to_records(frame):
+    """
+    Converts a DataFrame into the list-of-dicts format expected by the DataTable.
+
+    Equivalent to ``frame.to_dict("records")`` but zips plain row tuples, which avoids
+    pandas' per-cell boxing.
+
+    Args:
+        frame (pandas.DataFrame): The rows to convert.
+
+    Returns:
+        list[dict]: One dictionary per row, keyed by column name.
+    """
+    columns = list(frame.columns)
+    dict_ = dict  # Local alias avoids a global lookup per row
+    return [dict_(zip(columns, row)) for row in frame.itertuples(index=False, name=None)]
 
 # --- Dashboard Layout ---
-app.layout = html.Div(
-    style={
-        "fontFamily": "'Arial', sans-serif",  # Consistent font
-        "margin": "20px",
-        "backgroundColor": "#f4f4f4",  # Light background
-        "color": "#333"  # Darker text for readability
-    },
-    children=[
-        # Header Section
-        html.Div(
-            style={
-                "textAlign": "center",
-                "padding": "20px",
-                "backgroundColor": "#337ab7",  # Bootstrap primary blue
-                "color": "white",
-                "marginBottom": "20px",
-                "borderRadius": "8px"  # Rounded corners for a softer look
-            },
-            children=[
-                html.H1("🏭 Semilogo Warehouse Operations Dashboard", style={"fontSize": "2.8em"}),  # Larger heading
-                html.P("Monitor real-time performance and identify potential issues", style={"fontSize": "1.2em"})  # Subtitle
-            ]
-        ),
-
-        # Filters Section
-        html.Div(
-            style={
-                "display": "flex",
-                "flexWrap": "wrap",
-                "gap": "20px",  # Space between filter elements
-                "marginBottom": "30px",
-                "alignItems": "center"  # Vertically center items
-            },
-            children=[
-                html.Div(
-                    style={"flex": 1, "minWidth": "200px"},  # Flexible width, minimum width
-                    children=[
-                        html.Label("📅 Date Range:", style={"fontWeight": "bold", "display": "block", "marginBottom": "5px"}),
-                        dcc.DatePickerRange(
-                            id="date-range",
-                            min_date_allowed=df["timestamp"].min().date(),
-                            max_date_allowed=df["timestamp"].max().date(),
-                            start_date=df["timestamp"].min().date(),
-                            end_date=df["timestamp"].max().date(),
-                            style={"width": "100%"}  # Full width within the container
-                        )
-                    ]
-                ),
-                html.Div(
-                    style={"flex": 1, "minWidth": "200px"},
-                    children=[
-                        html.Label("⚙️ Machine:", style={"fontWeight": "bold", "display": "block", "marginBottom": "5px"}),
-                        dcc.Dropdown(
-                            id="machine-dropdown",
-                            options=[{"label": m, "value": m} for m in sorted(df["machine_id"].unique())],
-                            placeholder="Select a Machine",
-                            style={"width": "100%"}
-                        )
-                    ]
-                ),
-                html.Div(
-                    style={"flex": 1, "minWidth": "200px"},
-                    children=[
-                        html.Label("🚨 Error Code:", style={"fontWeight": "bold", "display": "block", "marginBottom": "5px"}),
-                        dcc.Dropdown(
-                            id="error-code-dropdown",
-                            options=[{"label": ec, "value": ec} for ec in sorted(df["error_code"].unique()) if ec != "None"],
-                            placeholder="Filter by Error Code(s)",
-                            multi=True,
-                            style={"width": "100%"}
-                        )
-                    ]
-                ),
-            ]
-        ),
-
-        # KPIs Section
-        html.Div(
-            style={
-                "display": "grid",
-                "gridTemplateColumns": "repeat(auto-fit, minmax(200px, 1fr))",  # Responsive grid layout
-                "gap": "20px",
-                "marginBottom": "30px"
-            },
-            children=[
-                html.Div(
-                    style={"backgroundColor": "white", "padding": "15px", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"},  # Styled container
-                    children=[
-                        html.H3("Total Tasks", style={"color": "#5cb85c"}),  # Green for success-related
-                        html.P(id="total-tasks-kpi", style={"fontSize": "1.8em", "fontWeight": "bold"})  # Large, bold number
-                    ]
-                ),
-                html.Div(
-                    style={"backgroundColor": "white", "padding": "15px", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"},
-                    children=[
-                        html.H3("Success Rate", style={"color": "#5bc0de"}),  # Cyan for info
-                        html.P(id="success-rate-kpi", style={"fontSize": "1.8em", "fontWeight": "bold"})
-                    ]
-                ),
-                html.Div(
-                    style={"backgroundColor": "white", "padding": "15px", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"},
-                    children=[
-                        html.H3("Avg. Duration (min)", style={"color": "#f0ad4e"}),  # Orange for warning/attention
-                        html.P(id="avg-duration-kpi", style={"fontSize": "1.8em", "fontWeight": "bold"})
-                    ]
-                ),
-                html.Div(
-                    style={"backgroundColor": "white", "padding": "15px", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"},
-                    children=[
-                        html.H3("Failure Rate", style={"color": "#d9534f"}),  # Red for error
-                        html.P(id="failure-rate-kpi", style={"fontSize": "1.8em", "fontWeight": "bold"})
-                    ]
-                ),
-            ]
-        ),
-
-        # Charts Section
-        html.Div(
-            style={
-                "display": "grid",
-                "gridTemplateColumns": "repeat(auto-fit, minmax(500px, 1fr))",  # Responsive columns
-                "gap": "20px",  # Space between charts
-                "marginBottom": "30px"
-            },
-            children=[
-                dcc.Graph(id="task-status-chart", style={"backgroundColor": "white", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"}),  # Styled chart container
-                dcc.Graph(id="duration-over-time-chart", style={"backgroundColor": "white", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"}),
-                dcc.Graph(id="error-distribution-chart", style={"backgroundColor": "white", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"}),
-                dcc.Graph(id="machine-performance-chart", style={"backgroundColor": "white", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"}),
-                # New Chart: Status Over Time
-                dcc.Graph(id="status-over-time-chart", style={"backgroundColor": "white", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"}),
-            ]
-        ),
-
-        # Data Table Section
-        html.Div(
-            style={"marginBottom": "20px"},
-            children=[
-                html.H2("Detailed Task Logs", style={"color": "#337ab7", "marginBottom": "15px"}),  # Styled heading
-                dash_table.DataTable(
-                    id="task-log-table",
-                    columns=[{"name": i, "id": i} for i in df.columns],  # Use DataFrame columns
-                    page_size=10,  # Initial page size
-                    style_cell={"textAlign": "left", "padding": "8px"},  # Consistent cell styling
-                    style_header={"backgroundColor": "#eee", "fontWeight": "bold"},  # Header styling
-                    style_data_conditional=[  # Conditional styling for failed tasks
-                        {
-                            "if": {"filter_query": '{status} = "failure"'},
-                            "backgroundColor": "#fdecea",  # Light red
-                            "color": "#d9534f",  # Darker red text
-                        }
-                    ],
-                    sort_action="native",  # Enable sorting
-                    filter_action="native"  # Enable filtering
-                ),
-            ]
-        ),
-
-        # Footer Section
-        html.Footer(
-            style={"textAlign": "center", "marginTop": "30px", "padding": "10px", "fontSize": "0.9em", "color": "#777"},  # Centered, smaller text
-            children=[
-                html.P("© 2025 Semilogo Warehouse Monitoring System")
-            ]
+def serve_layout():
+    """
+    Builds the dashboard layout. Dash calls this on every page load.
+
+    The layout only reads precomputed constants and the current snapshot's first and last
+    timestamps (an O(1) lookup on the sorted array), so a swapped-in dataset is picked up by the
+    next page load without scanning any rows.
+
+    Returns:
+        dash.html.Div: The root component of the dashboard.
+    """
+    timestamps = current_dataset().timestamps
+    min_date = pd.Timestamp(timestamps[0]).date() if len(timestamps) else None
+    max_date = pd.Timestamp(timestamps[-1]).date() if len(timestamps) else None
+
+    return html.Div(
+        style={
+            "fontFamily": "'Arial', sans-serif",  # Consistent font
+            "margin": "20px",
+            "backgroundColor": "#f4f4f4",  # Light background
+            "color": "#333"  # Darker text for readability
+        },
+        children=[
+            # Header Section
+            html.Div(
+                style={
+                    "textAlign": "center",
+                    "padding": "20px",
+                    "backgroundColor": "#337ab7",  # Bootstrap primary blue
+                    "color": "white",
+                    "marginBottom": "20px",
+                    "borderRadius": "8px"  # Rounded corners for a softer look
+                },
+                children=[
+                    html.H1("🏭 Semilogo Warehouse Operations Dashboard", style={"fontSize": "2.8em"}),  # Larger heading
+                    html.P("Monitor real-time performance and identify potential issues", style={"fontSize": "1.2em"})  # Subtitle
+                ]
+            ),
+
+            # Filters Section
+            html.Div(
+                style={
+                    "display": "flex",
+                    "flexWrap": "wrap",
+                    "gap": "20px",  # Space between filter elements
+                    "marginBottom": "30px",
+                    "alignItems": "center"  # Vertically center items
+                },
+                children=[
+                    html.Div(
+                        style={"flex": 1, "minWidth": "200px"},  # Flexible width, minimum width
+                        children=[
+                            html.Label("📅 Date Range:", style={"fontWeight": "bold", "display": "block", "marginBottom": "5px"}),
+                            dcc.DatePickerRange(
+                                id="date-range",
+                                min_date_allowed=min_date,
+                                max_date_allowed=max_date,
+                                start_date=min_date,
+                                end_date=max_date,
+                                style={"width": "100%"}  # Full width within the container
+                            )
+                        ]
+                    ),
+                    html.Div(
+                        style={"flex": 1, "minWidth": "200px"},
+                        children=[
+                            html.Label("⚙️ Machine:", style={"fontWeight": "bold", "display": "block", "marginBottom": "5px"}),
+                            dcc.Dropdown(
+                                id="machine-dropdown",
+                                options=MACHINE_OPTIONS,
+                                placeholder="Select a Machine",
+                                style={"width": "100%"}
+                            )
+                        ]
+                    ),
+                    html.Div(
+                        style={"flex": 1, "minWidth": "200px"},
+                        children=[
+                            html.Label("🚨 Error Code:", style={"fontWeight": "bold", "display": "block", "marginBottom": "5px"}),
+                            dcc.Dropdown(
+                                id="error-code-dropdown",
+                                options=ERROR_CODE_OPTIONS,
+                                placeholder="Filter by Error Code(s)",
+                                multi=True,
+                                style={"width": "100%"}
+                            )
+                        ]
+                    ),
+                ]
+            ),
+
+            # KPIs Section
+            html.Div(
+                style={
+                    "display": "grid",
+                    "gridTemplateColumns": "repeat(auto-fit, minmax(200px, 1fr))",  # Responsive grid layout
+                    "gap": "20px",
+                    "marginBottom": "30px"
+                },
+                children=[
+                    html.Div(
+                        style={"backgroundColor": "white", "padding": "15px", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"},  # Styled container
+                        children=[
+                            html.H3("Total Tasks", style={"color": "#5cb85c"}),  # Green for success-related
+                            html.P(id="total-tasks-kpi", style={"fontSize": "1.8em", "fontWeight": "bold"})  # Large, bold number
+                        ]
+                    ),
+                    html.Div(
+                        style={"backgroundColor": "white", "padding": "15px", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"},
+                        children=[
+                            html.H3("Success Rate", style={"color": "#5bc0de"}),  # Cyan for info
+                            html.P(id="success-rate-kpi", style={"fontSize": "1.8em", "fontWeight": "bold"})
+                        ]
+                    ),
+                    html.Div(
+                        style={"backgroundColor": "white", "padding": "15px", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"},
+                        children=[
+                            html.H3("Avg. Duration (min)", style={"color": "#f0ad4e"}),  # Orange for warning/attention
+                            html.P(id="avg-duration-kpi", style={"fontSize": "1.8em", "fontWeight": "bold"})
+                        ]
+                    ),
+                    html.Div(
+                        style={"backgroundColor": "white", "padding": "15px", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"},
+                        children=[
+                            html.H3("Failure Rate", style={"color": "#d9534f"}),  # Red for error
+                            html.P(id="failure-rate-kpi", style={"fontSize": "1.8em", "fontWeight": "bold"})
+                        ]
+                    ),
+                ]
+            ),
+
+            # Charts Section
+            html.Div(
+                style={
+                    "display": "grid",
+                    "gridTemplateColumns": "repeat(auto-fit, minmax(500px, 1fr))",  # Responsive columns
+                    "gap": "20px",  # Space between charts
+                    "marginBottom": "30px"
+                },
+                children=[
+                    dcc.Graph(id="task-status-chart", style={"backgroundColor": "white", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"}),  # Styled chart container
+                    dcc.Graph(id="duration-over-time-chart", style={"backgroundColor": "white", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"}),
+                    dcc.Graph(id="error-distribution-chart", style={"backgroundColor": "white", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"}),
+                    dcc.Graph(id="machine-performance-chart", style={"backgroundColor": "white", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"}),
+                    # New Chart: Status Over Time
+                    dcc.Graph(id="status-over-time-chart", style={"backgroundColor": "white", "borderRadius": "8px", "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"}),
+                ]
+            ),
+
+            # Data Table Section
+            html.Div(
+                style={"marginBottom": "20px"},
+                children=[
+                    html.H2("Detailed Task Logs", style={"color": "#337ab7", "marginBottom": "15px"}),  # Styled heading
+                    dash_table.DataTable(
+                        id="task-log-table",
+                        columns=TABLE_COLUMNS,
+                        page_current=0,
+                        page_size=10,  # Initial page size
+                        page_action="custom",  # Paging happens in the callback so only the visible page is sent
+                        style_cell={"textAlign": "left", "padding": "8px"},  # Consistent cell styling
+                        style_header={"backgroundColor": "#eee", "fontWeight": "bold"},  # Header styling
+                        style_data_conditional=[  # Conditional styling for failed tasks
+                            {
+                                "if": {"filter_query": '{status} = "failure"'},
+                                "backgroundColor": "#fdecea",  # Light red
+                                "color": "#d9534f",  # Darker red text
+                            }
+                        ],
+                        sort_action="custom",  # Sorting and filtering span all pages, so they run server-side too
+                        filter_action="custom"
+                    ),
+                ]
+            ),
+
+            # Footer Section
+            html.Footer(
+                style={"textAlign": "center", "marginTop": "30px", "padding": "10px", "fontSize": "0.9em", "color": "#777"},  # Centered, smaller text
+                children=[
+                    html.P("© 2025 Semilogo Warehouse Monitoring System")
+                ]
+            )
+        ]
+    )
+
+
+app.layout = serve_layout
+
+# --- Table Helpers ---
+TABLE_FILTER_OPERATORS = [
+    ["ge ", ">="],
+    ["le ", "<="],
+    ["lt ", "<"],
+    ["gt ", ">"],
+    ["ne ", "!="],
+    ["eq ", "="],
+    ["contains "],
+    ["datestartswith "],
+]
+
+
+def split_filter_part(filter_part):
+    """
+    Splits one clause of a DataTable filter query into its parts.
+
+    Args:
+        filter_part (str): A single clause, e.g. '{task_duration} >= 30'.
+
+    Returns:
+        tuple: (column name, operator, value), or (None, None, None) if the clause is not understood.
+    """
+    for operator_type in TABLE_FILTER_OPERATORS:
+        for operator in operator_type:
+            if operator in filter_part:
+                name_part, value_part = filter_part.split(operator, 1)
+                name = name_part[name_part.find("{") + 1: name_part.rfind("}")]
+                value_part = value_part.strip()
+                quote = value_part[:1]
+                if quote and quote == value_part[-1] and quote in ("'", '"', "`"):
+                    value = value_part[1:-1].replace("\\" + quote, quote)
+                elif operator_type[0] in ("contains ", "datestartswith "):
+                    value = value_part
+                else:
+                    try:
+                        value = float(value_part)
+                    except ValueError:
+                        value = value_part
+                return name, operator_type[0].strip(), value
+    return None, None, None
+
+
+def coerce_filter_value(column, value):
+    """
+    Converts a parsed filter value to the type of the column it is compared with.
+
+    Args:
+        column (pandas.Series): The column being filtered.
+        value: The value from ``split_filter_part``.
+
+    Returns:
+        The converted value, or None if it cannot be read as the column's type.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return str(value)
+    if pd.api.types.is_datetime64_dtype(column.dtype):
+        if isinstance(value, float) and value.is_integer():
+            value = str(int(value))  # A bare year such as "2026" was parsed as a number
+        value = pd.to_datetime(str(value), errors="coerce")
+    elif pd.api.types.is_numeric_dtype(column.dtype):
+        value = pd.to_numeric(value, errors="coerce")
+        if column.dtype == np.float32:
+            value = np.float32(value)  # Compare at the column's precision, so "= 34.33" still matches
+    return None if pd.isna(value) else value
+
+
+def displayed_strings(column):
+    """
+    Renders a column as the strings the DataTable displays, for the string filter operators.
+
+    Args:
+        column (pandas.Series): The column being filtered.
+
+    Returns:
+        pandas.Series: The column's values as displayed text.
+    """
+    if not pd.api.types.is_datetime64_dtype(column.dtype):
+        return column.astype(str)
+    # Timestamps reach the table as ISO strings, e.g. 2026-10-14T10:05:11.329945, with the
+    # fraction omitted when it is zero
+    return column.dt.strftime("%Y-%m-%dT%H:%M:%S.%f").where(
+        column.dt.microsecond != 0, column.dt.strftime("%Y-%m-%dT%H:%M:%S")
+    )
+
+
+def query_table(frame, sort_by, filter_query):
+    """
+    Applies the DataTable's filter query and sort order to a DataFrame.
+
+    Args:
+        frame (pandas.DataFrame): The dashboard-filtered rows.
+        sort_by (list): The table's sort_by property (dicts with column_id and direction).
+        filter_query (str): The table's filter_query property.
+
+    Returns:
+        pandas.DataFrame: The matching rows in the requested order.
+    """
+    for filter_part in (filter_query or "").split(" && "):
+        name, operator, value = split_filter_part(filter_part)
+        if name not in frame.columns:
+            continue
+        column = frame[name]
+        if operator in ("eq", "ne", "lt", "le", "gt", "ge"):
+            value = coerce_filter_value(column, value)
+            if value is None:
+                # A value that is not of the column's type (e.g. "abc" for a number) matches nothing
+                frame = frame.iloc[:0]
+                continue
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                column = column.astype(str)
+            mask = getattr(column, operator)(value)
+        elif operator == "contains":
+            mask = displayed_strings(column).str.contains(str(value), regex=False)
+        else:  # datestartswith
+            mask = displayed_strings(column).str.startswith(str(value))
+        frame = frame[mask.to_numpy()]
+
+    if sort_by:
+        frame = frame.sort_values(
+            [col["column_id"] for col in sort_by],
+            ascending=[col["direction"] == "asc" for col in sort_by],
+            # Categoricals sort by category order; the table sorts their labels alphabetically
+            key=lambda column: column.astype(str) if isinstance(column.dtype, pd.CategoricalDtype) else column,
         )
+    return frame
+
+
+# --- Figures ---
+SCATTER_MAX_POINTS = 5000  # Time bins per machine kept in the duration scatter
+STATUS_COLORS = {"success": "#5cb85c", "failure": "#d9534f"}
+# Clean white background. Resolving and validating a named template costs ~20ms per figure, so it is
+# serialized once here and attached to each figure's JSON instead
+PLOT_TEMPLATE = pio.templates["plotly_white"].to_plotly_json()
+
+
+def decimate(frame, max_points=SCATTER_MAX_POINTS):
+    """
+    Thins a DataFrame for scatter plotting by keeping one row per machine per time bin.
+
+    The time span of ``frame`` is split into ``max_points`` equal bins; frames that are already
+    small enough are returned unchanged.
+
+    Args:
+        frame (pandas.DataFrame): Rows to plot.
+        max_points (int): Number of time bins per machine.
+
+    Returns:
+        pandas.DataFrame: The first row of every occupied (machine, time bin) pair.
+    """
+    if len(frame) <= max_points:
+        return frame
+    ts = frame["timestamp"].to_numpy().view("i8")
+    start = ts.min()
+    span = ts.max() - start + 1
+    bins = ((ts - start) / span * max_points).astype(np.int64)
+    keys = pd.DataFrame({"machine_id": frame["machine_id"].cat.codes.to_numpy(), "bin": bins})
+    return frame[~keys.duplicated().to_numpy()]
+
+
+def figure_json(data, layout):
+    """
+    Builds a figure from graph_objects traces and returns it as a plain dict.
+
+    Args:
+        data (list): Traces for the figure.
+        layout (dict): Layout properties, without a template.
+
+    Returns:
+        dict: The figure as produced by ``Figure.to_plotly_json()``, using ``PLOT_TEMPLATE``.
+    """
+    # A constant uirevision lets Plotly.react diff the new figure in place, keeping zoom and legend state
+    fig = go.Figure(data, layout={**layout, "template": {}, "uirevision": "dashboard"}).to_plotly_json()
+    fig["layout"]["template"] = PLOT_TEMPLATE
+    return fig
+
+
+def tally_status(frame):
+    """
+    Counts tasks per machine and status in a single pass over the categorical codes.
+
+    Args:
+        frame (pandas.DataFrame): Rows to count.
+
+    Returns:
+        pandas.DataFrame: Task counts indexed by machine ID, with one column per status.
+    """
+    n_status = len(STATUS_DTYPE.categories)
+    keys = frame["machine_id"].cat.codes.to_numpy().astype(np.intp) * n_status + frame["status"].cat.codes.to_numpy()
+    counts = np.bincount(keys, minlength=len(MACHINE_ID_DTYPE.categories) * n_status)
+    return pd.DataFrame(
+        counts.reshape(-1, n_status),
+        index=MACHINE_ID_DTYPE.categories,
+        columns=STATUS_DTYPE.categories,
+    )
+
+
+def build_figures(filtered_df, error_counts, status_tally):
+    """
+    Builds the dashboard charts for a filtered DataFrame.
+
+    Args:
+        filtered_df (pandas.DataFrame): The rows matching the dashboard filters.
+        error_counts (dict): Failure counts per error code for the same filters.
+        status_tally (pandas.DataFrame): Output of ``tally_status`` for the same rows.
+
+    Returns:
+        tuple: The task status, duration over time, error distribution, machine performance and
+            status over time figures, as plain dicts from ``Figure.to_plotly_json()``.
+    """
+    # Figures are assembled from graph_objects traces over plain arrays, skipping plotly.express'
+    # per-call frame copies and column inference
+    status_counts = status_tally.sum(axis=0)
+    status_counts = status_counts[status_counts > 0]
+    task_status_fig = figure_json(
+        [go.Pie(
+            labels=status_counts.index.astype(str),
+            values=status_counts.to_numpy(),
+            marker={"colors": [STATUS_COLORS[s] for s in status_counts.index]},  # Green and Red
+        )],
+        layout={"title": "Task Status Distribution"}
+    )
+
+    scatter_df = decimate(filtered_df)  # Bounded point count regardless of data size
+    duration_over_time_fig = figure_json(
+        [
+            # WebGL draws all markers in one GPU pass instead of one SVG node per point
+            go.Scattergl(x=group["timestamp"].to_numpy(), y=group["task_duration"].to_numpy(), mode="markers", name=machine)
+            for machine, group in scatter_df.groupby("machine_id", observed=True)
+        ],
+        layout={
+            "title": "Task Duration Over Time",
+            "xaxis": {"title": "Timestamp"},  # Clear labels
+            "yaxis": {"title": "Duration (min)"},
+            "legend": {"title": "machine_id"},
+        }
+    )
+
+    error_distribution_fig = figure_json(
+        [go.Bar(x=[code], y=[count], name=code) for code, count in error_counts.items()],
+        layout={
+            "title": "Error Code Distribution",
+            "xaxis": {"title": "error_code"},
+            "yaxis": {"title": "count"},
+            "legend": {"title": "error_code"},
+        }
+    )
+
+    machine_counts = status_tally.sum(axis=1)
+    machine_counts = machine_counts[machine_counts > 0]
+    machine_performance_fig = figure_json(
+        [go.Bar(x=[machine], y=[count], name=machine) for machine, count in machine_counts.items()],
+        layout={
+            "title": "Tasks per Machine",
+            "xaxis": {"title": "Machine"},
+            "yaxis": {"title": "Number of Tasks"},
+            "legend": {"title": "Machine"},
+        }
+    )
+
+    # --- New Chart: Status Over Time ---
+    # Data covers the last 24 hours, so hourly bins (a monthly grouper collapsed it into one point)
+    # One groupby+size pass over (hour, status code) pairs, then a row-wise divide into percentages
+    status_counts = filtered_df.groupby([filtered_df["timestamp"].dt.floor("h"), "status"], observed=True).size().unstack("status", fill_value=0)
+    status_over_time = status_counts.div(status_counts.sum(axis=1), axis=0).mul(100)
+    status_over_time_fig = figure_json(
+        [
+            go.Scatter(x=status_over_time.index.to_numpy(), y=status_over_time[status].to_numpy(), mode="lines",
+                       name=status, line={"color": STATUS_COLORS[status]})
+            for status in status_over_time.columns
+        ],
+        layout={
+            "title": "Task Status Over Time",
+            "xaxis": {"title": "Hour"},
+            "yaxis": {"title": "Percentage"},
+            "legend": {"title": "Status"},
+        }
+    )
+
+    return task_status_fig, duration_over_time_fig, error_distribution_fig, machine_performance_fig, status_over_time_fig
+
+
+# --- Filtering ---
+def select_machine(dataset, machine_id):
+    """
+    Looks up the pre-bucketed data for a machine selection.
+
+    Args:
+        dataset (Dataset): The snapshot to read from.
+        machine_id (str): Selected machine ID, or None for all machines.
+
+    Returns:
+        tuple: (frame, int64 timestamp array, error code index) for the selection.
+    """
+    if machine_id:
+        return dataset.machine_buckets.get(machine_id, (dataset.df.iloc[:0], dataset.timestamps[:0], {}))
+    return dataset.df, dataset.timestamps, dataset.error_code_rows
+
+
+def date_slice(timestamps, start_date, end_date):
+    """
+    Locates the date range picker values in a sorted timestamp array.
+
+    Args:
+        timestamps (numpy.ndarray): Sorted int64 nanosecond timestamps.
+        start_date (str): Start date from the date range picker, or None.
+        end_date (str): End date from the date range picker, or None.
+
+    Returns:
+        tuple: (lo, hi) row positions such that ``timestamps[lo:hi]`` falls within the range.
+    """
+    lo = timestamps.searchsorted(parse_date(start_date)) if start_date else 0
+    # The end date is inclusive, so the bound is midnight of the following day
+    hi = timestamps.searchsorted(parse_date(end_date) + DAY_NS) if end_date else len(timestamps)
+    return lo, hi
+
+
+def filter_data(dataset, start_date, end_date, machine_id, error_codes):
+    """
+    Selects the rows matching the dashboard filters.
+
+    Args:
+        dataset (Dataset): The snapshot to read from.
+        start_date (str): Start date from the date range picker.
+        end_date (str): End date from the date range picker.
+        machine_id (str): Selected machine ID from the dropdown.
+        error_codes (list): Selected error codes from the dropdown.
+
+    Returns:
+        tuple: (frame, lo, hi, error_code_rows): the matching rows sorted by timestamp, the date
+            range's row positions in the machine selection, and that selection's error code index,
+            so callers can reuse the lookups instead of repeating them.
+    """
+    # The machine filter is a dictionary lookup into the pre-bucketed frames
+    base, base_timestamps, error_code_rows = select_machine(dataset, machine_id)
+
+    # Every frame is sorted by timestamp, so the date range is located with two binary searches
+    lo, hi = date_slice(base_timestamps, start_date, end_date)
+    if not error_codes:
+        return base.iloc[lo:hi], lo, hi, error_code_rows
+
+    # Error codes come from the inverted index: only the matching rows inside [lo, hi) are touched
+    parts = [
+        rows[rows.searchsorted(lo):rows.searchsorted(hi)]
+        for code, rows in error_code_rows.items()
+        if code in error_codes
     ]
-)
+    positions = np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+    return base.iloc[positions], lo, hi, error_code_rows
+
+
+# Figures and KPI values for a selection with no rows, built once so empty selections skip figure construction
+_empty_df = current_dataset().df.iloc[:0]
+EMPTY_SUMMARY = build_figures(_empty_df, {}, tally_status(_empty_df)) + (0, "0%", "0.00", "0%")
+del _empty_df
+
+
+@cache.memoize()
+def summarize(dataset, start_date, end_date, machine_id, error_codes):
+    """
+    Computes the figures and KPI values for a filter selection.
+
+    Memoized on the dataset version and the filter values, so table paging and repeated selections
+    skip this work while a swapped-in dataset never serves stale results.
+
+    Args:
+        dataset (Dataset): The snapshot to read from.
+        start_date (str): Start date from the date range picker.
+        end_date (str): End date from the date range picker.
+        machine_id (str): Selected machine ID from the dropdown.
+        error_codes (tuple): Selected error codes from the dropdown.
+
+    Returns:
+        tuple: The five figures from ``build_figures`` followed by the total tasks, success rate,
+            average duration and failure rate KPI values.
+    """
+    filtered_df, lo, hi, error_code_rows = filter_data(dataset, start_date, end_date, machine_id, error_codes)
+    if filtered_df.empty:
+        # Empty charts rather than no_update, so the previous selection's charts are not left on screen
+        return EMPTY_SUMMARY
+
+    # --- KPI Calculations ---
+    # One machine x status tally feeds the KPIs, the status pie and the machine chart
+    status_tally = tally_status(filtered_df)
+    total_tasks = int(status_tally.to_numpy().sum())
+    success_count = int(status_tally["success"].sum())
+    success_rate = f"{((success_count / total_tasks) * 100):.2f}%"
+    # Averaged in float64 over the two-decimal values, so the KPI rounds as it did before the float32 downcast
+    avg_duration = f"{filtered_df['task_duration'].to_numpy(np.float64).round(2).mean():.2f}"
+    failure_rate = f"{(((total_tasks - success_count) / total_tasks) * 100):.2f}%"
+
+    # --- Charts ---
+    error_counts = count_failures(error_code_rows, lo, hi, error_codes)
+    figures = build_figures(filtered_df, error_counts, status_tally)
+    return figures + (total_tasks, success_rate, avg_duration, failure_rate)
+
 
 # --- Callbacks ---
+# Charts and KPIs only depend on the dashboard filters, so they live in their own callback and
+# table paging, sorting and filtering never re-send the figures
 @app.callback(
     [Output("task-status-chart", "figure"),
      Output("duration-over-time-chart", "figure"),
      Output("error-distribution-chart", "figure"),
      Output("machine-performance-chart", "figure"),
-     Output("task-log-table", "data"),
      Output("total-tasks-kpi", "children"),
      Output("success-rate-kpi", "children"),
      Output("avg-duration-kpi", "children"),
@@ -234,7 +921,7 @@ app.layout = html.Div(
 )
 def update_dashboard(start_date, end_date, machine_id, error_codes):
     """
-    Callback function to update the dashboard based on user-selected filters.
+    Callback function to update the charts and KPIs based on user-selected filters.
 
     Args:
         start_date (str): Start date from the date range picker.
@@ -245,78 +932,15 @@ def update_dashboard(start_date, end_date, machine_id, error_codes):
     Returns:
         tuple: A tuple containing updated Plotly figures and KPI values.
     """
-    filtered_df = df.copy()  # Create a copy to avoid modifying the original DataFrame
-
-    # --- Filtering ---
-    if start_date:
-        filtered_df = filtered_df[filtered_df["timestamp"].dt.date >= pd.to_datetime(start_date).date()]
-    if end_date:
-        filtered_df = filtered_df[filtered_df["timestamp"].dt.date <= pd.to_datetime(end_date).date()]
-    if machine_id:
-        filtered_df = filtered_df[filtered_df["machine_id"] == machine_id]
-    if error_codes:
-        filtered_df = filtered_df[filtered_df["error_code"].isin(error_codes)]
-
-    # --- KPI Calculations ---
-    total_tasks = len(filtered_df)
-    success_count = len(filtered_df[filtered_df["status"] == "success"])
-    success_rate = f"{((success_count / total_tasks) * 100):.2f}%" if total_tasks > 0 else "0%"
-    avg_duration = f"{filtered_df['task_duration'].mean():.2f}" if not filtered_df.empty else "0.00"
-    failure_rate = f"{(((total_tasks - success_count) / total_tasks) * 100):.2f}%" if total_tasks > 0 else "0%"
-
-    # --- Charts ---
-    task_status_fig = px.pie(
-        filtered_df,
-        names="status",
-        title="Task Status Distribution",
-        color_discrete_sequence=["#5cb85c", "#d9534f"],  # Green and Red
-        template="plotly_white"  # Clean white background
-    )
-
-    duration_over_time_fig = px.scatter(
-        filtered_df,
-        x="timestamp",
-        y="task_duration",
-        color="machine_id",
-        title="Task Duration Over Time",
-        labels={"timestamp": "Timestamp", "task_duration": "Duration (min)"},  # Clear labels
-        template="plotly_white"
-    )
-
-    error_distribution_fig = px.bar(
-        filtered_df[filtered_df["status"] == "failure"],  # Only show errors
-        x="error_code",
-        color="error_code",
-        title="Error Code Distribution",
-        template="plotly_white"
-    )
-
-    machine_performance_fig = px.bar(
-        filtered_df.groupby("machine_id")["status"].count().reset_index(name="count"),
-        x="machine_id",
-        y="count",
-        color="machine_id",
-        title="Tasks per Machine",
-        labels={"machine_id": "Machine", "count": "Number of Tasks"},
-        template="plotly_white"
-    )
-
-    # --- New Chart: Status Over Time ---
-    print("First few timestamps in filtered_df:")  # Debugging: Print timestamps
-    print(filtered_df['timestamp'].head())
-    status_over_time = filtered_df.groupby(pd.Grouper(key='timestamp', freq='M'))['status'].value_counts(normalize=True).mul(100).rename('percentage').reset_index()
-    status_over_time_fig = px.line(status_over_time, x='timestamp', y='percentage', color='status',
-                                  title='Task Status Over Time',
-                                  labels={'timestamp': 'Month', 'percentage': 'Percentage', 'status': 'Status'},
-                                  color_discrete_sequence=["#5cb85c", "#d9534f"],
-                                  template="plotly_white")
+    error_codes = tuple(sorted(error_codes or ()))  # Hashable, and sorted so any selection order hits the same cache entry
+    (task_status_fig, duration_over_time_fig, error_distribution_fig, machine_performance_fig, status_over_time_fig,
+     total_tasks, success_rate, avg_duration, failure_rate) = summarize(current_dataset(), start_date, end_date, machine_id, error_codes)
 
     return (
         task_status_fig,
         duration_over_time_fig,
         error_distribution_fig,
         machine_performance_fig,
-        filtered_df.to_dict("records"),
         total_tasks,
         success_rate,
         avg_duration,
@@ -324,5 +948,48 @@ def update_dashboard(start_date, end_date, machine_id, error_codes):
         status_over_time_fig  # Return the new figure
     )
 
+
+@app.callback(
+    [Output("task-log-table", "data"),
+     Output("task-log-table", "page_count"),
+     Output("task-log-table", "page_current")],
+    [Input("date-range", "start_date"),
+     Input("date-range", "end_date"),
+     Input("machine-dropdown", "value"),
+     Input("error-code-dropdown", "value"),
+     Input("task-log-table", "page_current"),
+     Input("task-log-table", "page_size"),
+     Input("task-log-table", "sort_by"),
+     Input("task-log-table", "filter_query")]
+)
+def update_table(start_date, end_date, machine_id, error_codes, page_current, page_size, sort_by, filter_query):
+    """
+    Callback function to serve the visible page of the task log table.
+
+    Args:
+        start_date (str): Start date from the date range picker.
+        end_date (str): End date from the date range picker.
+        machine_id (str): Selected machine ID from the dropdown.
+        error_codes (list): Selected error codes from the dropdown.
+        page_current (int): Zero-based index of the table page being viewed.
+        page_size (int): Number of rows per table page.
+        sort_by (list): Sort order requested through the table headers.
+        filter_query (str): Filter expression typed into the table's filter row.
+
+    Returns:
+        tuple: The page's records, the page count and the (possibly clamped) current page.
+    """
+    # Only the visible page is serialized; sorting and filtering still cover every row
+    filtered_df = filter_data(current_dataset(), start_date, end_date, machine_id, tuple(sorted(error_codes or ())))[0]
+    table_df = query_table(filtered_df, sort_by, filter_query)
+    page_count = max(-(-len(table_df) // page_size), 1)
+    # Narrower filters can leave the current page past the end; move back to the last one
+    page_current = min(page_current or 0, page_count - 1)
+    page_df = table_df.iloc[page_current * page_size:(page_current + 1) * page_size]
+    # Widen the float32 durations back to their two-decimal values, so the table shows 34.33 rather than 34.33000183
+    page_df = page_df.assign(task_duration=page_df["task_duration"].astype(np.float64).round(2))
+    table_records = to_records(page_df)
+    return table_records, page_count, page_current
+
 if __name__ == '__main__':
     app.run_server(debug=True)